@@ -4,11 +4,29 @@ Deploy ContextDescriptionApp to SiteGround
 Uploads the main app to public_html/app/ directory
 """
 
+import fnmatch
 import ftplib
+import functools
+import gzip
+import hashlib
+import io
+import json
 import os
+from datetime import datetime, timezone
 from pathlib import Path
 import argparse
+import asyncio
+import contextlib
+import queue
+import re
+import shlex
+import shutil
+import socket
+import subprocess
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 # Load environment variables if available
 try:
@@ -24,6 +42,72 @@ try:
 except ImportError:
     print("⚠️  python-dotenv not installed, using environment variables only")
 
+# Optional asyncio FTP client for --async deployments
+try:
+    import aioftp
+except ImportError:
+    aioftp = None
+
+# Optional SIMD-accelerated hashing for the upload manifest
+try:
+    import blake3
+except ImportError:
+    blake3 = None
+
+class DeployFTP(ftplib.FTP_TLS):
+    """FTP(S) session that can pipeline simple commands on the control connection."""
+    
+    # Commands sent before reading any replies; keeps the server's reply backlog small
+    pipeline_depth = 50
+    # Large send buffer and blocks keep the TCP window full on high-latency links
+    send_buffer_size = 4 * 1024 * 1024
+    transfer_blocksize = 1024 * 1024
+    
+    def connect(self, *args, **kwargs):
+        """Connect with Nagle disabled so bursts of short commands go out immediately."""
+        welcome = super().connect(*args, **kwargs)
+        self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        return welcome
+    
+    def ntransfercmd(self, cmd, rest=None):
+        """Open the data connection with an enlarged send buffer."""
+        conn, size = super().ntransfercmd(cmd, rest)
+        conn.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, self.send_buffer_size)
+        return conn, size
+    
+    def pipeline(self, commands):
+        """Send commands back-to-back and collect their replies in order.
+        
+        Failed commands yield the ftplib error instead of raising, so one
+        rejected MKD/DELE does not desynchronise the remaining replies.
+        """
+        replies = []
+        for start in range(0, len(commands), self.pipeline_depth):
+            batch = commands[start:start + self.pipeline_depth]
+            for command in batch:
+                self.putcmd(command)
+            for command in batch:
+                try:
+                    replies.append(self.getresp())
+                except (ftplib.error_perm, ftplib.error_temp) as e:
+                    replies.append(e)
+        return replies
+
+class RangeReader:
+    """File-like view of length bytes of an open file, read on demand by storbinary."""
+    
+    def __init__(self, f, offset, length):
+        self.f = f
+        self.f.seek(offset)
+        self.remaining = length
+    
+    def read(self, size=-1):
+        if size < 0 or size > self.remaining:
+            size = self.remaining
+        data = self.f.read(size)
+        self.remaining -= len(data)
+        return data
+
 class AppDeployer:
     """Deploy ContextDescriptionApp to SiteGround."""
     
@@ -32,10 +116,32 @@ class AppDeployer:
         self.username = os.environ.get('SITEGROUND_USERNAME', '')
         self.password = os.environ.get('SITEGROUND_PASSWORD', '')
         self.remote_app_path = 'bobd77.sg-host.com/public_html/app'
+        # Explicit FTPS is on unless SITEGROUND_FTP_TLS=0
+        self.use_tls = os.environ.get('SITEGROUND_FTP_TLS', '1') != '0'
+        
+        # Concurrent FTP sessions including the main one (SiteGround rejects too many logins)
+        self.max_workers = 8
+        # Attempts per file when the server answers with a transient 4xx (e.g. 425)
+        self.upload_attempts = 3
+        # Files above this size are split across parallel data connections
+        self.parallel_threshold = 4 * 1024 * 1024
+        self.parallel_streams = 4
+        # Cleared after the first failed ranged upload (e.g. REST past EOF refused)
+        self.parallel_ranges_ok = True
+        self._print_lock = threading.Lock()
+        self._pool_lock = threading.Lock()
+        self._active_workers = 0
         
         # Local app directory
         self.local_app_dir = Path(__file__).parent
         
+        # Text assets also get a precompressed .gz sibling for Apache to serve
+        self.gzip_suffixes = {'.js', '.css', '.html', '.svg', '.json'}
+        self.gzip_cache_dir = Path.home() / '.cache' / 'deploy_app'
+        
+        # Content hashes of the last successful upload, keyed by remote path
+        self.manifest_file = self.local_app_dir / '.deploy-manifest.json'
+        
         # Files and directories to upload
         self.upload_items = [
             'index.html',
@@ -60,17 +166,43 @@ class AppDeployer:
             'VERSION_COMPARISON.md',
             'SYSTEM_DESIGN.md',
             'TILE_*',
+            '.deploy-manifest.json',
         ]
+        
+        # Exact names are a set lookup; globs share one compiled regex
+        self._exclude_names = frozenset(p for p in self.exclude_patterns if '*' not in p)
+        self._exclude_re = re.compile('|'.join(
+            fnmatch.translate(p) for p in self.exclude_patterns if '*' in p
+        ) or r'(?!)')
+        self._exclude_cached = functools.lru_cache(maxsize=8192)(self._match_exclude)
+    
+    def _match_exclude(self, path_str):
+        """Check each component of a path against the exclude patterns."""
+        return any(
+            part in self._exclude_names or self._exclude_re.match(part)
+            for part in Path(path_str).parts
+        )
     
     def should_exclude(self, path):
         """Check if a file/directory should be excluded."""
-        path_str = str(path)
-        for pattern in self.exclude_patterns:
-            if pattern in path_str or path.name == pattern:
-                return True
-            if pattern.startswith('*.') and path.name.endswith(pattern[1:]):
-                return True
-        return False
+        path = Path(path)
+        # Only match below the app directory so its own location cannot exclude everything
+        if path.is_relative_to(self.local_app_dir):
+            path = path.relative_to(self.local_app_dir)
+        return self._exclude_cached(str(path))
+    
+    def log(self, message):
+        """Print a message without interleaving output from upload workers."""
+        with self._print_lock:
+            print(message)
+    
+    def connect(self):
+        """Open and authenticate a new FTP session."""
+        ftp = DeployFTP(self.host)
+        ftp.login(self.username, self.password, secure=self.use_tls)
+        if self.use_tls:
+            ftp.prot_p()
+        return ftp
     
     def check_credentials(self):
         """Check if SiteGround credentials are configured."""
@@ -83,113 +215,475 @@ class AppDeployer:
     
     def create_remote_directory(self, ftp, path):
         """Create remote directory structure if it doesn't exist."""
-        parts = path.strip('/').split('/')
-        current_path = ''
+        parts = [part for part in path.strip('/').split('/') if part]
+        self.create_remote_directories(
+            ftp, ['/'.join(parts[:depth]) for depth in range(1, len(parts) + 1)]
+        )
+    
+    def create_remote_directories(self, ftp, dirs):
+        """Create remote directories, parents first, one pipelined MKD per directory.
         
-        for part in parts:
-            if part:
-                current_path += f'/{part}' if current_path else part
-                try:
-                    ftp.mkd(current_path)
-                    print(f"📁 Created directory: {current_path}")
-                except ftplib.error_perm:
-                    # Directory already exists or creation failed
-                    try:
-                        ftp.cwd(current_path)
-                        ftp.cwd('/')  # Go back to root
-                    except ftplib.error_perm:
-                        print(f"❌ Cannot create or access directory: {current_path}")
-                        raise
+        Existing directories are not probed with CWD; their MKD simply fails
+        with 550 (or 521 on some servers), which is ignored.
+        """
+        ordered = sorted(dirs, key=lambda d: d.count('/'))
+        replies = ftp.pipeline([f'MKD {remote_dir}' for remote_dir in ordered])
+        
+        for remote_dir, reply in zip(ordered, replies):
+            if not isinstance(reply, ftplib.Error):
+                print(f"📁 Created directory: {remote_dir}")
+            elif not str(reply).startswith(('550', '521')):
+                print(f"❌ Cannot create directory: {remote_dir}")
+                raise reply
+    
+    def compress_asset(self, local_file):
+        """Gzip a text asset, reusing the cached result while its mtime is unchanged."""
+        stat = local_file.stat()
+        cache_key = hashlib.sha1(f"{local_file.resolve()}:{stat.st_mtime_ns}".encode()).hexdigest()
+        cache_file = self.gzip_cache_dir / f"{cache_key}.gz"
+        
+        if cache_file.exists():
+            return cache_file.read_bytes()
+        
+        compressed = gzip.compress(local_file.read_bytes(), compresslevel=9, mtime=0)
+        
+        try:
+            self.gzip_cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_file = cache_file.with_suffix(f'.{threading.get_ident()}.tmp')
+            tmp_file.write_bytes(compressed)
+            os.replace(tmp_file, cache_file)
+        except OSError:
+            pass  # Cache is best-effort
+        
+        return compressed
+    
+    def store_file(self, ftp, local_file, remote_file):
+        """Upload a single file and its .gz sibling, raising on failure."""
+        with open(local_file, 'rb') as f:
+            ftp.storbinary(f'STOR {remote_file}', f, blocksize=ftp.transfer_blocksize)
+        self.log(f"📄 Uploaded: {local_file.name} -> {remote_file}")
+        self.upload_gzip_sibling(ftp, local_file, remote_file)
+    
+    def try_upload(self, ftp, local_file, remote_file):
+        """Upload a file, retrying transient (4xx) failures; returns the final error or None."""
+        for attempt in range(1, self.upload_attempts + 1):
+            try:
+                self.store_file(ftp, local_file, remote_file)
+                return None
+            except ftplib.error_temp as e:
+                if attempt == self.upload_attempts:
+                    return e
+                self.log(f"⚠️  Retrying {local_file.name} ({e})")
+                time.sleep(attempt)
+            except Exception as e:
+                return e
     
     def upload_file(self, ftp, local_file, remote_file):
         """Upload a single file."""
+        error = self.try_upload(ftp, local_file, remote_file)
+        if error is not None:
+            self.log(f"❌ Failed to upload {local_file}: {error}")
+        return error is None
+    
+    def upload_gzip_sibling(self, ftp, local_file, remote_file):
+        """Upload the precompressed .gz copy of a text asset."""
+        if local_file.suffix not in self.gzip_suffixes:
+            return
+        
         try:
+            compressed = self.compress_asset(local_file)
+            ftp.storbinary(f'STOR {remote_file}.gz', io.BytesIO(compressed),
+                           blocksize=ftp.transfer_blocksize)
+        except Exception:
+            # Never leave a stale .gz next to a freshly uploaded original
+            try:
+                ftp.delete(f"{remote_file}.gz")
+            except ftplib.all_errors:
+                pass
+            raise
+        self.log(f"🗜️  Uploaded: {local_file.name}.gz -> {remote_file}.gz")
+    
+    def upload_chunk(self, local_file, remote_file, offset, length):
+        """Upload one byte range of a file with REST + STOR on its own connection."""
+        with open(local_file, 'rb') as f, self.connect() as ftp:
+            ftp.storbinary(f'STOR {remote_file}', RangeReader(f, offset, length),
+                           blocksize=ftp.transfer_blocksize, rest=offset)
+    
+    def upload_file_parallel(self, ftp, local_file, remote_file, n_streams=4):
+        """Upload a large file as byte ranges over parallel data connections.
+        
+        The first range goes over the main connection with a plain (truncating)
+        STOR before any other stream starts, since servers treat REST 0 as a
+        normal STOR. Not every server accepts REST beyond the current end of
+        file either; if any range is rejected or the final remote size is
+        wrong, the file is re-sent over a single stream and ranged uploads
+        are turned off for the rest of the run.
+        """
+        if not self.parallel_ranges_ok:
+            return self.upload_file(ftp, local_file, remote_file)
+        
+        size = local_file.stat().st_size
+        chunk_len = -(-size // n_streams)
+        offsets = range(chunk_len, size, chunk_len)
+        
+        try:
+            # Truncates any previous copy, so stale bytes never survive past the new end
             with open(local_file, 'rb') as f:
-                ftp.storbinary(f'STOR {remote_file}', f)
-            print(f"📄 Uploaded: {local_file.name} -> {remote_file}")
+                ftp.storbinary(f'STOR {remote_file}', RangeReader(f, 0, chunk_len),
+                               blocksize=ftp.transfer_blocksize)
+            
+            with ThreadPoolExecutor(max_workers=n_streams) as executor:
+                futures = [
+                    executor.submit(self.upload_chunk, local_file, remote_file, offset, chunk_len)
+                    for offset in offsets
+                ]
+                for future in futures:
+                    future.result()
+            
+            remote_size = ftp.size(remote_file)
+            if remote_size != size:
+                raise ftplib.error_reply(f"remote size {remote_size} != local size {size}")
+            
+            self.log(f"📄 Uploaded: {local_file.name} -> {remote_file} ({len(offsets) + 1} streams)")
+            self.upload_gzip_sibling(ftp, local_file, remote_file)
             return True
-        except Exception as e:
-            print(f"❌ Failed to upload {local_file}: {e}")
-            return False
+        except ftplib.all_errors as e:
+            self.parallel_ranges_ok = False
+            self.log(f"⚠️  Parallel upload of {local_file.name} failed ({e}), "
+                     f"using single streams for the rest of this deploy")
+            return self.upload_file(ftp, local_file, remote_file)
+    
+    def upload_worker(self, tasks):
+        """Drain upload tasks over a dedicated FTP connection.
+        
+        A worker that cannot log in (e.g. the server's concurrent-login cap),
+        whose connection dies, or that keeps getting transient 4xx replies
+        while other workers are still running stops and leaves its tasks to
+        the others. The last worker standing records failures instead.
+        """
+        uploaded = []
+        
+        try:
+            ftp = self.connect()
+        except ftplib.all_errors as e:
+            self.log(f"⚠️  Upload connection failed: {e}")
+            return uploaded
+        
+        with self._pool_lock:
+            self._active_workers += 1
+        released = False
+        
+        try:
+            with ftp:
+                while True:
+                    try:
+                        local_file, remote_file = tasks.get_nowait()
+                    except queue.Empty:
+                        break
+                    
+                    error = self.try_upload(ftp, local_file, remote_file)
+                    if error is None:
+                        uploaded.append(remote_file)
+                        tasks.task_done()
+                        continue
+                    
+                    try:
+                        ftp.voidcmd('NOOP')
+                        alive = True
+                    except ftplib.all_errors:
+                        alive = False
+                    
+                    with self._pool_lock:
+                        # Hand the file back if the connection died, or shrink the
+                        # pool when the server keeps refusing (e.g. 425 at its cap)
+                        if not alive or (isinstance(error, ftplib.error_temp) and self._active_workers > 1):
+                            self._active_workers -= 1
+                            released = True
+                    
+                    if released:
+                        self.log(f"⚠️  Releasing upload connection ({error}), leaving remaining files to others")
+                        tasks.put((local_file, remote_file))
+                        tasks.task_done()
+                        break
+                    
+                    self.log(f"❌ Failed to upload {local_file}: {error}")
+                    tasks.task_done()
+        finally:
+            if not released:
+                with self._pool_lock:
+                    self._active_workers -= 1
+        
+        return uploaded
     
-    def upload_directory(self, ftp, local_dir, remote_dir):
-        """Recursively upload a directory."""
-        uploaded_count = 0
+    def upload_files(self, tasks):
+        """Upload queued (local, remote) pairs over a pool; returns remote paths uploaded."""
+        if tasks.empty():
+            return []
         
-        for item in local_dir.iterdir():
-            if self.should_exclude(item):
-                print(f"⏭️  Skipped: {item.name}")
+        # The main session stays open, so it counts against the connection budget
+        workers = min(self.max_workers - 1, tasks.qsize())
+        print(f"🔀 Uploading {tasks.qsize()} files over {workers} connections...")
+        
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(self.upload_worker, tasks) for _ in range(workers)]
+            uploaded = [remote_file for future in futures for remote_file in future.result()]
+        
+        if not tasks.empty():
+            raise ftplib.error_temp(f"{tasks.qsize()} files not uploaded, no upload connection left")
+        return uploaded
+    
+    def _collect_tree(self):
+        """Collect remote directories and (local, remote) file pairs to upload."""
+        dirs = set()
+        files = list(self.iter_upload_files(dirs))
+        return sorted(dirs), files
+    
+    def iter_upload_files(self, remote_dirs=None):
+        """Yield (local, remote) pairs for every file to upload.
+        
+        Excluded directories are pruned before descent. If remote_dirs is a
+        set, each remote directory the walk visits is added to it.
+        """
+        for item_name in self.upload_items:
+            local_item = self.local_app_dir / item_name
+            
+            if not local_item.exists():
+                print(f"⚠️  Skipped missing item: {item_name}")
                 continue
             
-            remote_item_path = f"{remote_dir}/{item.name}"
+            if self.should_exclude(local_item):
+                continue
+            
+            if local_item.is_file():
+                yield local_item, f"{self.remote_app_path}/{item_name}"
+                continue
+            
+            for dirpath, dirnames, filenames in os.walk(local_item, topdown=True):
+                dirnames[:] = sorted(d for d in dirnames if not self.should_exclude(os.path.join(dirpath, d)))
+                
+                rel_dir = Path(dirpath).relative_to(self.local_app_dir).as_posix()
+                remote_dir = f"{self.remote_app_path}/{rel_dir}"
+                if remote_dirs is not None:
+                    remote_dirs.add(remote_dir)
+                
+                for filename in sorted(filenames):
+                    local_file = os.path.join(dirpath, filename)
+                    if not self.should_exclude(local_file):
+                        yield Path(local_file), f"{remote_dir}/{filename}"
+    
+    def list_remote_directory(self, ftp, path):
+        """List a remote directory with MLSD, split into file and directory paths."""
+        files = []
+        dirs = []
+        
+        # 'type' is a default MLSD fact, so no (possibly refused) OPTS MLST is needed
+        for name, facts in ftp.mlsd(path):
+            entry_type = facts.get('type', '').lower()
+            if entry_type == 'file':
+                files.append(f"{path}/{name}")
+            elif entry_type == 'dir':
+                dirs.append(f"{path}/{name}")
+        
+        return files, dirs
+    
+    def build_remote_index(self, ftp, dirs):
+        """Map remote file paths to (size, mtime) using one MLSD per directory.
+        
+        Returns None if the server does not support MLSD.
+        """
+        remote_index = {}
+        
+        # Ask for the facts we need; servers that reject OPTS MLST still list their defaults
+        try:
+            ftp.sendcmd('OPTS MLST type;size;modify;')
+        except ftplib.error_perm:
+            pass
+        
+        for remote_dir in dirs:
+            try:
+                entries = list(ftp.mlsd(remote_dir))
+            except ftplib.error_perm as e:
+                if str(e).startswith('550'):
+                    continue  # Directory is new, nothing to compare against
+                return None
             
-            if item.is_file():
-                if self.upload_file(ftp, item, remote_item_path):
-                    uploaded_count += 1
-            elif item.is_dir():
-                # Create remote directory
+            for name, facts in entries:
+                if facts.get('type', '').lower() != 'file':
+                    continue
+                try:
+                    # MLSD modify is UTC, YYYYMMDDHHMMSS[.sss]
+                    modified = datetime.strptime(facts['modify'][:14], '%Y%m%d%H%M%S')
+                    size = int(facts['size'])
+                except (KeyError, ValueError):
+                    continue  # Missing or malformed facts, upload this file unconditionally
+                remote_mtime = modified.replace(tzinfo=timezone.utc).timestamp()
+                remote_index[f"{remote_dir}/{name}"] = (size, remote_mtime)
+        
+        return remote_index
+    
+    def is_unchanged(self, local_file, remote_file, remote_index):
+        """Check if the remote copy has the same size and is not older."""
+        remote_entry = remote_index.get(remote_file)
+        if remote_entry is None:
+            return False
+        
+        remote_size, remote_mtime = remote_entry
+        stat = local_file.stat()
+        return stat.st_size == remote_size and stat.st_mtime <= remote_mtime
+    
+    def can_skip(self, local_file, remote_file, local_hash, manifest, remote_index):
+        """Decide whether a file is already up to date on the server.
+        
+        A manifest entry is authoritative: the hash must match, and if the
+        remote listing is available the remote copy must exist with the local
+        size. Only files without a manifest entry fall back to size + mtime.
+        Text assets are never skipped while their .gz sibling is missing.
+        """
+        if remote_index is not None and local_file.suffix in self.gzip_suffixes:
+            # A missing .gz sibling means the last upload of this asset did not finish
+            if f"{remote_file}.gz" not in remote_index:
+                return False
+        
+        if remote_file in manifest:
+            if manifest[remote_file] != local_hash:
+                return False
+            if remote_index is None:
+                return True
+            remote_entry = remote_index.get(remote_file)
+            return remote_entry is not None and remote_entry[0] == local_file.stat().st_size
+        
+        return bool(remote_index) and self.is_unchanged(local_file, remote_file, remote_index)
+    
+    def hash_file(self, local_file):
+        """Content hash of a local file, prefixed with the algorithm used."""
+        with open(local_file, 'rb') as f:
+            if blake3 is not None:
+                hasher = blake3.blake3()
+                while chunk := f.read(1024 * 1024):
+                    hasher.update(chunk)
+                return f"blake3:{hasher.hexdigest()}"
+            return f"sha256:{hashlib.file_digest(f, 'sha256').hexdigest()}"
+    
+    def load_manifest(self):
+        """Load the remote path -> content hash manifest from the last deploy."""
+        try:
+            return json.loads(self.manifest_file.read_text())
+        except (OSError, ValueError):
+            return {}
+    
+    def save_manifest(self, manifest):
+        """Write the manifest atomically so an interrupted deploy cannot corrupt it."""
+        tmp_file = self.manifest_file.with_suffix('.tmp')
+        tmp_file.write_text(json.dumps(manifest, indent=2, sort_keys=True))
+        os.replace(tmp_file, self.manifest_file)
+    
+    def delete_remote_files(self, ftp, files):
+        """Delete remote files with pipelined DELE commands."""
+        replies = ftp.pipeline([f'DELE {remote_file}' for remote_file in files])
+        
+        for remote_file, reply in zip(files, replies):
+            if isinstance(reply, ftplib.Error):
+                self.log(f"⚠️  Could not delete: {remote_file}")
+            else:
+                self.log(f"🗑️  Deleted file: {remote_file}")
+    
+    def remove_remote_directories(self, ftp, dirs):
+        """Remove empty remote directories with pipelined RMD commands."""
+        replies = ftp.pipeline([f'RMD {remote_dir}' for remote_dir in dirs])
+        
+        for remote_dir, reply in zip(dirs, replies):
+            if isinstance(reply, ftplib.Error):
+                self.log(f"⚠️  Could not delete: {remote_dir}")
+            else:
+                self.log(f"🗑️  Deleted directory: {remote_dir}")
+    
+    def delete_worker(self, batches):
+        """Drain DELE batches over a dedicated FTP connection; returns whether it logged in.
+        
+        Like upload_worker, a worker that cannot log in or whose connection
+        dies leaves its batches to the others.
+        """
+        try:
+            ftp = self.connect()
+        except ftplib.all_errors as e:
+            self.log(f"⚠️  Delete connection failed: {e}")
+            return False
+        
+        with ftp:
+            while True:
                 try:
-                    ftp.mkd(remote_item_path)
-                    print(f"📁 Created directory: {remote_item_path}")
-                except ftplib.error_perm:
-                    pass  # Directory might already exist
+                    batch = batches.get_nowait()
+                except queue.Empty:
+                    break
                 
-                # Recursively upload directory contents
-                sub_count = self.upload_directory(ftp, item, remote_item_path)
-                uploaded_count += sub_count
+                try:
+                    self.delete_remote_files(ftp, batch)
+                except ftplib.all_errors as e:
+                    self.log(f"⚠️  Releasing delete connection ({e}), leaving remaining files to others")
+                    batches.put(batch)
+                    break
+        
+        return True
+    
+    def delete_files_on_pool(self, ftp, files):
+        """Delete remote files over a pool, finishing on ftp whatever the pool left."""
+        if not files:
+            return
+        
+        batches = queue.Queue()
+        for i in range(0, len(files), DeployFTP.pipeline_depth):
+            batches.put(files[i:i + DeployFTP.pipeline_depth])
+        
+        # The main session stays open, so it counts against the connection budget
+        workers = min(self.max_workers - 1, batches.qsize())
+        if workers > 0:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [executor.submit(self.delete_worker, batches) for _ in range(workers)]
+                connected = sum(future.result() for future in futures)
+            if not connected:
+                print("⚠️  No delete connections available, deleting over the main session")
         
-        return uploaded_count
+        while True:
+            try:
+                batch = batches.get_nowait()
+            except queue.Empty:
+                break
+            self.delete_remote_files(ftp, batch)
+    
+    def list_remote_tree(self, ftp, remote_path):
+        """Recursively list a remote directory into (files, dirs) with MLSD.
+        
+        Subdirectories that cannot be listed are reported and left out.
+        """
+        files, dirs = self.list_remote_directory(ftp, remote_path)
+        
+        for remote_dir in list(dirs):
+            try:
+                sub_files, sub_dirs = self.list_remote_tree(ftp, remote_dir)
+            except ftplib.error_perm as e:
+                print(f"⚠️  Could not list {remote_dir}: {e}")
+                continue
+            files += sub_files
+            dirs += sub_dirs
+        
+        return files, dirs
     
     def clean_remote_directory(self, ftp, remote_path):
         """Clean the remote app directory before upload."""
         try:
-            # Try to change to app directory
-            ftp.cwd(remote_path)
-            
-            # List all items
-            items = []
-            ftp.retrlines('NLST', items.append)
-            
-            # Delete files and directories
-            for item in items:
-                if item not in ['.', '..']:
-                    try:
-                        # Try to delete as file first
-                        ftp.delete(item)
-                        print(f"🗑️  Deleted file: {item}")
-                    except ftplib.error_perm:
-                        # Might be a directory, try to remove it
-                        try:
-                            self.remove_directory(ftp, item)
-                            print(f"🗑️  Deleted directory: {item}")
-                        except:
-                            print(f"⚠️  Could not delete: {item}")
-            
-            # Go back to root
-            ftp.cwd('/')
-            
-        except ftplib.error_perm:
+            files, dirs = self.list_remote_tree(ftp, remote_path)
+        except ftplib.error_perm as e:
+            if not str(e).startswith('550'):
+                print(f"❌ Could not list {remote_path}: {e}")
+                raise
             # Directory doesn't exist yet, that's fine
             print(f"📁 Remote directory {remote_path} doesn't exist yet")
-    
-    def remove_directory(self, ftp, path):
-        """Recursively remove a directory."""
-        try:
-            ftp.cwd(path)
-            items = []
-            ftp.retrlines('NLST', items.append)
-            
-            for item in items:
-                if item not in ['.', '..']:
-                    try:
-                        ftp.delete(item)
-                    except ftplib.error_perm:
-                        self.remove_directory(ftp, item)
-            
-            ftp.cwd('..')
-            ftp.rmd(path)
-        except:
-            pass
+            return
+        
+        # Files first, then directories deepest first so each RMD finds them empty;
+        # one pipeline on one connection keeps that order
+        self.delete_files_on_pool(ftp, files)
+        self.remove_remote_directories(ftp, sorted(dirs, key=lambda d: d.count('/'), reverse=True))
     
     def deploy(self, clean=False):
         """Deploy the app to SiteGround."""
@@ -200,10 +694,20 @@ class AppDeployer:
         print(f"📂 Local app directory: {self.local_app_dir}")
         print(f"🌐 Remote app path: {self.remote_app_path}")
         
+        dirs, files = self._collect_tree()
+        manifest = {} if clean else self.load_manifest()
+        
+        # Hash local files in the background while logging in and preparing directories
+        hash_executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        hash_futures = {
+            remote_file: hash_executor.submit(self.hash_file, local_file)
+            for local_file, remote_file in files
+        }
+        hash_executor.shutdown(wait=False)
+        
         try:
-            with ftplib.FTP(self.host) as ftp:
-                print(f"🔗 Connecting to {self.host}...")
-                ftp.login(self.username, self.password)
+            print(f"🔗 Connecting to {self.host}...")
+            with self.connect() as ftp:
                 print("✅ Connected successfully")
                 
                 # Create remote app directory
@@ -215,39 +719,55 @@ class AppDeployer:
                     print("🧹 Cleaning remote directory...")
                     self.clean_remote_directory(ftp, self.remote_app_path)
                 
-                # Upload files
-                total_uploaded = 0
+                # Create all directories up front, then upload over the pool
+                self.create_remote_directories(ftp, dirs)
                 
-                for item_name in self.upload_items:
-                    local_item = self.local_app_dir / item_name
-                    
-                    if not local_item.exists():
-                        print(f"⚠️  Skipped missing item: {item_name}")
+                # Compare against remote metadata unless everything was just wiped
+                remote_index = None
+                if not clean:
+                    remote_index = self.build_remote_index(ftp, [self.remote_app_path] + dirs)
+                    if remote_index is None:
+                        print("⚠️  Server does not support MLSD, uploading all files")
+                
+                hashes = {remote_file: future.result() for remote_file, future in hash_futures.items()}
+                
+                tasks = queue.Queue()
+                large_files = []
+                skipped = []
+                for local_file, remote_file in files:
+                    if not clean and self.can_skip(local_file, remote_file, hashes[remote_file],
+                                                   manifest, remote_index):
+                        skipped.append(remote_file)
                         continue
-                    
-                    remote_item_path = f"{self.remote_app_path}/{item_name}"
-                    
-                    if local_item.is_file():
-                        if self.upload_file(ftp, local_item, remote_item_path):
-                            total_uploaded += 1
-                    elif local_item.is_dir():
-                        # Create remote directory
-                        try:
-                            ftp.mkd(remote_item_path)
-                            print(f"📁 Created directory: {remote_item_path}")
-                        except ftplib.error_perm:
-                            pass  # Directory might already exist
-                        
-                        # Upload directory contents
-                        count = self.upload_directory(ftp, local_item, remote_item_path)
-                        total_uploaded += count
+                    if local_file.stat().st_size > self.parallel_threshold:
+                        large_files.append((local_file, remote_file))
+                    else:
+                        tasks.put((local_file, remote_file))
+                
+                pending_count = tasks.qsize() + len(large_files)
+                uploaded = self.upload_files(tasks)
+                
+                # Large files get the connection budget to themselves, one at a time
+                for local_file, remote_file in large_files:
+                    if self.upload_file_parallel(ftp, local_file, remote_file, self.parallel_streams):
+                        uploaded.append(remote_file)
                 
-                print(f"\n🎉 Deployment complete!")
+                # Record what the server now holds; failed uploads drop out and retry next time
+                self.save_manifest({remote_file: hashes[remote_file] for remote_file in skipped + uploaded})
+                total_uploaded = len(uploaded)
+                skipped_count = len(skipped)
+                failed_count = pending_count - total_uploaded
+                
+                if failed_count:
+                    print(f"\n❌ Deployment incomplete: {failed_count} files failed to upload")
+                else:
+                    print(f"\n🎉 Deployment complete!")
                 print(f"📊 Total files uploaded: {total_uploaded}")
+                print(f"⏭️  Unchanged files skipped: {skipped_count}")
                 print(f"🌐 App URL: https://bobd77.sg-host.com/app/")
                 print(f"🗺️  Tiles URL: https://bobd77.sg-host.com/tiles/")
                 
-                return True
+                return failed_count == 0
                 
         except ftplib.all_errors as e:
             print(f"❌ FTP error: {e}")
@@ -256,6 +776,196 @@ class AppDeployer:
             print(f"❌ Deployment error: {e}")
             return False
 
+    def build_lftp_script(self):
+        """Build the lftp command script that mirrors upload_items to the server.
+        
+        The remote app directory must already exist (see deploy_lftp), so every
+        command in the script is expected to succeed.
+        """
+        remote = shlex.quote(self.remote_app_path)
+        
+        # Stop at the first failing command so its status becomes lftp's exit code
+        commands = ['set cmd:fail-exit yes']
+        if self.use_tls:
+            commands += ['set ftp:ssl-force true', 'set ftp:ssl-protect-data true']
+        else:
+            commands.append('set ftp:ssl-allow false')
+        
+        # Password comes from LFTP_PASSWORD so it never appears in the process list
+        commands.append(f"open -u {shlex.quote(self.username)} --env-password {shlex.quote(self.host)}")
+        
+        # Directories match exclude globs with a trailing slash
+        excludes = ' '.join(
+            f"--exclude-glob {shlex.quote(p)} --exclude-glob {shlex.quote(p + '/')}"
+            for p in self.exclude_patterns
+        )
+        
+        for item_name in self.upload_items:
+            local_item = self.local_app_dir / item_name
+            if not local_item.exists():
+                print(f"⚠️  Skipped missing item: {item_name}")
+                continue
+            
+            if local_item.is_file():
+                commands.append(f"put -O {remote} {shlex.quote(str(local_item))}")
+            else:
+                remote_dir = shlex.quote(f"{self.remote_app_path}/{item_name.rstrip('/')}")
+                commands.append(
+                    f"mirror -R --parallel={self.max_workers} --only-newer {excludes} "
+                    f"{shlex.quote(str(local_item))} {remote_dir}"
+                )
+        
+        commands.append('bye')
+        return '; '.join(commands)
+    
+    def deploy_lftp(self, clean=False):
+        """Deploy by shelling out to lftp, falling back to deploy() if it isn't installed."""
+        lftp = shutil.which('lftp')
+        if lftp is None:
+            print("⚠️  lftp not found, using built-in FTP deployment")
+            return self.deploy(clean=clean)
+        if not self.check_credentials():
+            return False
+        
+        print("🚀 Starting ContextDescriptionApp deployment to SiteGround with lftp...")
+        print(f"📂 Local app directory: {self.local_app_dir}")
+        print(f"🌐 Remote app path: {self.remote_app_path}")
+        
+        # Prepare the target with ftplib, whose 'already exists' handling we control;
+        # under cmd:fail-exit an lftp mkdir/rm of an existing/missing path would abort
+        try:
+            with self.connect() as ftp:
+                self.create_remote_directory(ftp, self.remote_app_path)
+                if clean:
+                    print("🧹 Cleaning remote directory...")
+                    self.clean_remote_directory(ftp, self.remote_app_path)
+                else:
+                    # lftp doesn't regenerate .gz siblings, so drop them rather than
+                    # let the server keep serving stale compressed copies
+                    siblings = [f"{remote_file}.gz" for local_file, remote_file in self.iter_upload_files()
+                                if local_file.suffix in self.gzip_suffixes]
+                    removed = sum(not isinstance(reply, ftplib.Error) for reply in ftp.pipeline(
+                        [f'DELE {sibling}' for sibling in siblings]))
+                    if removed:
+                        print(f"🗑️  Removed {removed} stale .gz siblings")
+        except ftplib.all_errors as e:
+            print(f"❌ FTP error: {e}")
+            return False
+        
+        env = dict(os.environ, LFTP_PASSWORD=self.password)
+        try:
+            subprocess.run([lftp, '-c', self.build_lftp_script()], env=env, check=True)
+        except subprocess.CalledProcessError as e:
+            print(f"❌ lftp failed with exit code {e.returncode}")
+            return False
+        finally:
+            # lftp changed the server behind the manifest's back; force a full check next time
+            self.manifest_file.unlink(missing_ok=True)
+        
+        print(f"\n🎉 Deployment complete!")
+        print(f"🌐 App URL: https://bobd77.sg-host.com/app/")
+        print(f"🗺️  Tiles URL: https://bobd77.sg-host.com/tiles/")
+        return True
+    
+    async def _upload_async(self, pool, local_file, remote_file):
+        """Upload one file (and its .gz sibling) with a client borrowed from the pool."""
+        client = await pool.get()
+        try:
+            # Disk reads and gzip run in worker threads so other uploads keep flowing
+            async with client.upload_stream(remote_file) as stream:
+                with open(local_file, 'rb') as f:
+                    while chunk := await asyncio.to_thread(f.read, DeployFTP.transfer_blocksize):
+                        await stream.write(chunk)
+            self.log(f"📄 Uploaded: {local_file.name} -> {remote_file}")
+            
+            if local_file.suffix in self.gzip_suffixes:
+                compressed = await asyncio.to_thread(self.compress_asset, local_file)
+                async with client.upload_stream(f"{remote_file}.gz") as stream:
+                    await stream.write(compressed)
+                self.log(f"🗜️  Uploaded: {local_file.name}.gz -> {remote_file}.gz")
+            return True
+        except Exception as e:
+            self.log(f"❌ Failed to upload {local_file}: {e}")
+            return False
+        finally:
+            pool.put_nowait(client)
+    
+    async def _deploy_async(self, clean):
+        """Deploy over a pool of aioftp clients sharing one event loop."""
+        dirs, files = self._collect_tree()
+        
+        async with contextlib.AsyncExitStack() as stack:
+            workers = max(1, min(self.max_workers, len(files)))
+            results = await asyncio.gather(*(
+                stack.enter_async_context(aioftp.Client.context(
+                    self.host, user=self.username, password=self.password,
+                    upgrade_to_tls=self.use_tls,
+                ))
+                for _ in range(workers)
+            ), return_exceptions=True)
+            
+            # Logins refused by a connection cap just mean a smaller pool
+            clients = [result for result in results if not isinstance(result, BaseException)]
+            for error in (result for result in results if isinstance(result, BaseException)):
+                print(f"⚠️  Upload connection failed: {error}")
+            if not clients:
+                raise next(result for result in results if isinstance(result, BaseException))
+            workers = len(clients)
+            print(f"✅ Connected successfully ({workers} connections)")
+            
+            ftp = clients[0]
+            await ftp.make_directory(self.remote_app_path)
+            
+            if clean:
+                print("🧹 Cleaning remote directory...")
+                for path, _ in await ftp.list(self.remote_app_path):
+                    await ftp.remove(path)
+                    print(f"🗑️  Deleted: {path}")
+            
+            for remote_dir in dirs:
+                try:
+                    await ftp.command(f"MKD {remote_dir}", "257")
+                    print(f"📁 Created directory: {remote_dir}")
+                except aioftp.StatusCodeError:
+                    pass  # Directory already exists
+            
+            # The pool hands out each client to one upload at a time
+            pool = asyncio.Queue()
+            for client in clients:
+                pool.put_nowait(client)
+            
+            print(f"🔀 Uploading {len(files)} files over {workers} connections...")
+            results = await asyncio.gather(*(
+                self._upload_async(pool, local_file, remote_file)
+                for local_file, remote_file in files
+            ))
+            return sum(results)
+    
+    def deploy_async(self, clean=False):
+        """Deploy the app to SiteGround using asyncio (requires aioftp)."""
+        if aioftp is None:
+            print("❌ aioftp not installed, run: pip install aioftp")
+            return False
+        if not self.check_credentials():
+            return False
+        
+        print("🚀 Starting async ContextDescriptionApp deployment to SiteGround...")
+        print(f"📂 Local app directory: {self.local_app_dir}")
+        print(f"🌐 Remote app path: {self.remote_app_path}")
+        print(f"🔗 Connecting to {self.host}...")
+        
+        try:
+            total_uploaded = asyncio.run(self._deploy_async(clean))
+        except Exception as e:
+            print(f"❌ Deployment error: {e}")
+            return False
+        
+        print(f"\n🎉 Deployment complete!")
+        print(f"📊 Total files uploaded: {total_uploaded}")
+        print(f"🌐 App URL: https://bobd77.sg-host.com/app/")
+        print(f"🗺️  Tiles URL: https://bobd77.sg-host.com/tiles/")
+        return True
+
 def main():
     """Main deployment script."""
     parser = argparse.ArgumentParser(description='Deploy ContextDescriptionApp to SiteGround')
@@ -263,6 +973,10 @@ def main():
                        help='Clean remote directory before upload')
     parser.add_argument('--dry-run', action='store_true',
                        help='Show what would be uploaded without actually uploading')
+    parser.add_argument('--async', dest='use_async', action='store_true',
+                       help='Upload with asyncio and aioftp instead of threads')
+    parser.add_argument('--lftp', action='store_true',
+                       help='Mirror with lftp if installed (falls back to built-in upload)')
     
     args = parser.parse_args()
     
@@ -272,25 +986,23 @@ def main():
         print("🔍 DRY RUN - Showing what would be uploaded:")
         print(f"📂 Local directory: {deployer.local_app_dir}")
         print(f"🌐 Remote path: {deployer.remote_app_path}")
-        print("\nItems to upload:")
+        print("\nFiles to upload:")
         
-        for item_name in deployer.upload_items:
-            local_item = deployer.local_app_dir / item_name
-            if local_item.exists():
-                if local_item.is_file():
-                    print(f"📄 {item_name}")
-                else:
-                    print(f"📁 {item_name}/")
-                    for subitem in local_item.rglob('*'):
-                        if not deployer.should_exclude(subitem):
-                            rel_path = subitem.relative_to(deployer.local_app_dir)
-                            print(f"   📄 {rel_path}")
-            else:
-                print(f"⚠️  Missing: {item_name}")
+        file_count = 0
+        for local_file, _ in deployer.iter_upload_files():
+            print(f"📄 {local_file.relative_to(deployer.local_app_dir)}")
+            file_count += 1
+        
+        print(f"\n📊 {file_count} files")
         return
     
     # Perform actual deployment
-    success = deployer.deploy(clean=args.clean)
+    if args.lftp:
+        success = deployer.deploy_lftp(clean=args.clean)
+    elif args.use_async:
+        success = deployer.deploy_async(clean=args.clean)
+    else:
+        success = deployer.deploy(clean=args.clean)
     sys.exit(0 if success else 1)
 
 if __name__ == '__main__':
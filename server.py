@@ -5,19 +5,32 @@ Serves static files and proxies tile requests
 """
 
 import http.server
-import socketserver
 import os
 import sys
 import urllib.parse
 import gzip
+import shutil
+from functools import lru_cache
 from pathlib import Path
 
 PORT = 8000
 TILE_DIR = "../tile-generation/toronto-svg-tiles/tiles"
 
+# Tiles up to this size are kept in memory; larger ones are streamed with sendfile
+TILE_CACHE_MAX_BYTES = 256 * 1024
+
+@lru_cache(maxsize=2048)
+def _load_tile(full_path, mtime_ns):
+    """Read a tile; mtime_ns is part of the cache key so edited tiles are reloaded"""
+    with open(full_path, 'rb') as f:
+        return f.read()
+
 class CustomHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
     """Custom handler to serve tiles and enable CORS"""
     
+    # Keep connections open between requests; every response sends Content-Length
+    protocol_version = "HTTP/1.1"
+    
     def end_headers(self):
         """Add CORS headers to all responses"""
         self.send_header('Access-Control-Allow-Origin', '*')
@@ -28,6 +41,7 @@ class CustomHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
     def do_OPTIONS(self):
         """Handle preflight requests"""
         self.send_response(200)
+        self.send_header('Content-Length', '0')
         self.end_headers()
     
     def do_GET(self):
@@ -54,24 +68,53 @@ class CustomHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
             self.send_error(404, f"Tile not found: {tile_path}")
             return
         
+        headers_sent = False
         try:
-            # Read the gzipped file
-            with open(full_path, 'rb') as f:
-                content = f.read()
+            st = os.stat(full_path)
             
-            # Send response
-            self.send_response(200)
-            self.send_header('Content-Type', 'image/svg+xml')
-            self.send_header('Content-Encoding', 'gzip')
-            self.send_header('Content-Length', str(len(content)))
-            self.send_header('Cache-Control', 'public, max-age=3600')
-            self.end_headers()
+            if st.st_size <= TILE_CACHE_MAX_BYTES:
+                # Hot tiles are answered from memory
+                content = _load_tile(full_path, st.st_mtime_ns)
+                self.send_tile_headers(len(content))
+                headers_sent = True
+                self.wfile.write(content)
+                return
             
-            # Write content
-            self.wfile.write(content)
+            with open(full_path, 'rb') as f:
+                size = os.fstat(f.fileno()).st_size
+                self.send_tile_headers(size)
+                headers_sent = True
+                
+                # Let the kernel copy the gzipped file straight to the socket
+                self.wfile.flush()
+                if hasattr(os, 'sendfile'):
+                    offset = 0
+                    while offset < size:
+                        sent = os.sendfile(self.connection.fileno(), f.fileno(), offset, size - offset)
+                        if sent == 0:
+                            # File shrank mid-send; the body is short of Content-Length
+                            self.close_connection = True
+                            break
+                        offset += sent
+                else:
+                    shutil.copyfileobj(f, self.wfile)
             
         except Exception as e:
-            self.send_error(500, f"Error serving tile: {str(e)}")
+            if headers_sent:
+                # Too late for an error status; drop the connection so the client sees a short body
+                self.log_error("Error serving tile %s: %s", tile_path, e)
+                self.close_connection = True
+            else:
+                self.send_error(500, f"Error serving tile: {str(e)}")
+    
+    def send_tile_headers(self, size):
+        """Send the status line and headers for a gzipped SVG tile"""
+        self.send_response(200)
+        self.send_header('Content-Type', 'image/svg+xml')
+        self.send_header('Content-Encoding', 'gzip')
+        self.send_header('Content-Length', str(size))
+        self.send_header('Cache-Control', 'public, max-age=3600')
+        self.end_headers()
     
     def log_message(self, format, *args):
         """Custom log format"""
@@ -90,8 +133,8 @@ def main():
     else:
         print(f"Serving tiles from: {tile_path.absolute()}")
     
-    # Create and start server
-    with socketserver.TCPServer(("", PORT), CustomHTTPRequestHandler) as httpd:
+    # Create and start server, one thread per connection so parallel tile requests don't queue
+    with http.server.ThreadingHTTPServer(("", PORT), CustomHTTPRequestHandler) as httpd:
         print(f"Server running at http://localhost:{PORT}/")
         print("Press Ctrl+C to stop the server")
         